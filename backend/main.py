@@ -1,37 +1,95 @@
 import os
 import re
+import sys
 import uuid
+import hashlib
+import functools
+import itertools
 import asyncio
 import tempfile
 import subprocess
+from collections import OrderedDict
+from contextlib import asynccontextmanager
 from pathlib import Path
+from typing import AsyncIterator, Iterator
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
 
-import yt_dlp
 import opencc
+import orjson
 import httpx
-from groq import Groq
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect, File, UploadFile, Form
-from fastapi.responses import FileResponse, JSONResponse
-from pydantic import BaseModel
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
+import redis.asyncio as redis
+from redis.exceptions import RedisError
+from groq import AsyncGroq, BadRequestError
+from fastapi import FastAPI, WebSocket, WebSocketDisconnect, File, UploadFile, Form, Header
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import FileResponse, ORJSONResponse, Response, StreamingResponse
+from pydantic import BaseModel, ConfigDict
 
 SRT_DIR = Path(tempfile.gettempdir()) / "srt_output"
 SRT_DIR.mkdir(exist_ok=True)
+SRT_ROOT = SRT_DIR.resolve()  # canonical form for download containment checks
+SRT_MEDIA_TYPE = "application/x-subrip"
+
+# Groq Whisper client (native async; no worker threads per request).
+# The SDK retries 429/5xx with jittered exponential backoff honouring Retry-After.
+GROQ_MAX_RETRIES = 4
+groq_client = AsyncGroq(api_key=os.getenv("GROQ_API_KEY"), max_retries=GROQ_MAX_RETRIES)
+
+# Simplified -> Traditional converter (for Cantonese output), built lazily
+@functools.cache
+def _get_s2t() -> opencc.OpenCC:
+    return opencc.OpenCC("s2t")
 
-# Groq Whisper client
-groq_client = Groq(api_key=os.getenv("GROQ_API_KEY"))
 
-# Simplified -> Traditional converter (for Cantonese output)
-_s2t = opencc.OpenCC("s2t")
+# Sentence boundaries used to split long segments into cacheable clauses
+_CLAUSE_SPLIT = re.compile(r"(?<=[。！？!?])")
+_CLAUSE_SPLIT_MIN_LEN = 64
+# Control char that OpenCC passes through untouched, for batched conversion
+_BATCH_SEP = "\x01"
 
 # Ollama Cloud API
 OLLAMA_API_KEY = os.getenv("OLLAMA_API_KEY")
 OLLAMA_ENDPOINT = "https://ollama.com/api/chat"
 OLLAMA_MODEL = "deepseek-v3.2"
 
+# Shared client: keeps the TLS/HTTP2 connection to Ollama warm across calls
+_ollama_client = httpx.AsyncClient(
+    timeout=120.0,
+    http2=True,
+    limits=httpx.Limits(max_keepalive_connections=20),
+)
+
+# Optional shared Redis cache for transcripts / summaries (skipped if unset)
+REDIS_URL = os.getenv("REDIS_URL")
+REDIS_CACHE_TTL_SEC = 7 * 24 * 3600
+REDIS_TIMEOUT_SEC = 0.5  # a slow or blackholed Redis counts as a cache miss
+_redis = (
+    redis.from_url(
+        REDIS_URL,
+        decode_responses=True,
+        socket_connect_timeout=REDIS_TIMEOUT_SEC,
+        socket_timeout=REDIS_TIMEOUT_SEC,
+    )
+    if REDIS_URL
+    else None
+)
+
+# In-process LRU of recent summaries, keyed by hash of (mode, text)
+SUMMARY_CACHE_SIZE = 256
+_summary_cache: OrderedDict[str, str] = OrderedDict()
+
 # Minutes Agent: max upload size
 MINUTES_MAX_FILE_SIZE = 100 * 1024 * 1024  # 100MB
+UPLOAD_BLOCK_SIZE = 1 << 20  # 1 MB read size when saving uploads
+# Audio-only upload formats Groq accepts as-is (no re-encode needed)
+_PASSTHROUGH_EXTS = {".mp3", ".wav", ".m4a", ".ogg", ".flac"}
+# Lossless formats only pass through at 16-bit: wider samples make 600 s
+# chunks exceed GROQ_MAX_FILE_SIZE (24-bit wav is 28.8 MB per chunk)
+_LOSSLESS_EXTS = {".wav", ".flac"}
 
 _SUMMARY_PROMPT = """You are an AI assistant that summarizes video transcripts. You will receive SRT subtitle text from a YouTube video.
 
@@ -62,102 +120,207 @@ _POLISH_PROMPT = """角色設定：
 
 請整理以下語音轉文字內容："""
 
-YOUTUBE_URL_PATTERN = re.compile(
-    r"^https?://(www\.)?(youtube\.com/watch\?|youtu\.be/|youtube\.com/shorts/)"
+# Accepted YouTube URL prefixes: http(s)://[www.]{youtube.com/watch?,youtu.be/,youtube.com/shorts/}
+YOUTUBE_URL_PREFIXES = tuple(
+    f"{scheme}://{www}{path}"
+    for scheme in ("http", "https")
+    for www in ("", "www.")
+    for path in ("youtube.com/watch?", "youtu.be/", "youtube.com/shorts/")
 )
 
+# 11-char video ID after watch?v= / youtu.be/ / shorts/
+_VIDEO_ID_PATTERN = re.compile(r"(?:[?&]v=|youtu\.be/|shorts/)([A-Za-z0-9_-]{11})")
+
 # Trusted origin patterns (any *.vercel.app + explicitly configured origins)
 _EXTRA_ORIGINS = [
     o.strip()
     for o in os.getenv("ALLOWED_ORIGINS", "").split(",")
     if o.strip() and o.strip() != "*"
 ]
-_VERCEL_PATTERN = re.compile(r"^https://[a-z0-9\-]+\.vercel\.app$")
+_VERCEL_ORIGIN_REGEX = r"https://[a-z0-9\-]+\.vercel\.app"
 
 
-def _origin_allowed(origin: str) -> bool:
-    if not origin:
-        return False
-    if _VERCEL_PATTERN.match(origin):
-        return True
-    return origin in _EXTRA_ORIGINS
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    await _ollama_client.aclose()
+    if _redis is not None:
+        await _redis.aclose()
 
 
-class DynamicCORSMiddleware(BaseHTTPMiddleware):
-    """Allow any *.vercel.app origin + explicit ALLOWED_ORIGINS."""
+app = FastAPI(
+    title="YouTube SRT Transcriber API",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
+)
 
-    async def dispatch(self, request: Request, call_next):
-        origin = request.headers.get("origin", "")
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=_EXTRA_ORIGINS,
+    allow_origin_regex=_VERCEL_ORIGIN_REGEX,
+    allow_credentials=True,
+    allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
+    allow_headers=["Content-Type", "Authorization"],
+    max_age=600,
+)
 
-        if request.method == "OPTIONS":
-            # Preflight
-            if _origin_allowed(origin):
-                from starlette.responses import Response
 
-                return Response(
-                    status_code=200,
-                    headers={
-                        "Access-Control-Allow-Origin": origin,
-                        "Access-Control-Allow-Methods": "GET, POST, PUT, DELETE, OPTIONS",
-                        "Access-Control-Allow-Headers": "Content-Type, Authorization",
-                        "Access-Control-Allow-Credentials": "true",
-                        "Access-Control-Max-Age": "600",
-                    },
-                )
+class TranscribeRequest(BaseModel):
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
-        response = await call_next(request)
+    youtube_url: str
+    language: str = "yue"
+    persist: bool = True  # False: touch no disk (no cache entry, no download file)
 
-        if _origin_allowed(origin):
-            response.headers["Access-Control-Allow-Origin"] = origin
-            response.headers["Access-Control-Allow-Credentials"] = "true"
 
-        return response
+class SummarizeRequest(BaseModel):
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
+    text: str
+    mode: str = "summary"  # "summary" or "polish"
 
-app = FastAPI(title="YouTube SRT Transcriber API")
 
-app.add_middleware(DynamicCORSMiddleware)
+class LiveSTTConfig(BaseModel):
+    """First websocket message of a live-STT session."""
 
+    model_config = ConfigDict(frozen=True)
 
-class TranscribeRequest(BaseModel):
-    youtube_url: str
     language: str = "yue"
 
 
-class SummarizeRequest(BaseModel):
-    text: str
-    mode: str = "summary"  # "summary" or "polish"
-
-
 # --------------- helpers ---------------
 
 
 GROQ_MAX_FILE_SIZE = 24 * 1024 * 1024  # 24 MB (leave margin under 25 MB limit)
 CHUNK_DURATION_SEC = 600  # 10-minute chunks
+# Max in-flight Groq requests, shared by every endpoint in this process
+GROQ_CONCURRENCY = int(os.getenv("GROQ_CONCURRENCY", "6"))
 
+PIPE_BUFSIZE = 1 << 20  # 1 MB kernel pipe between yt-dlp and ffmpeg (Linux)
+YTDLP_CONCURRENT_FRAGMENTS = 8  # parallel DASH/HLS fragment fetches
+_YTDLP_FORMAT_UNAVAILABLE = "Requested format is not available"
+LIVE_PIPELINE_DEPTH = 4  # live-STT chunks allowed in flight per connection
 
-def _download_audio(youtube_url: str) -> str:
-    """Download audio from a YouTube URL, return path to .mp3 file."""
-    stem = str(SRT_DIR / str(uuid.uuid4()))
-    ydl_opts = {
-        "format": "bestaudio/best",
-        "postprocessors": [
-            {
-                "key": "FFmpegExtractAudio",
-                "preferredcodec": "mp3",
-                "preferredquality": "0",
-            }
-        ],
-        "outtmpl": stem,
-        "quiet": True,
-        "no_warnings": True,
-    }
-    with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-        ydl.download([youtube_url])
-    mp3_path = stem + ".mp3"
-    if not Path(mp3_path).exists():
-        raise FileNotFoundError("yt-dlp failed to produce an audio file")
-    return mp3_path
+_groq_sem = asyncio.Semaphore(GROQ_CONCURRENCY)
+
+TRANSCRIPT_CACHE_MAX_BYTES = 200 * 1024 * 1024  # on-disk SRT cache budget
+_CACHE_PREFIX = "yt_"  # transcript cache entries; never served by name
+
+# Temp file names only need to be unique on this host: a per-process tag
+# plus a counter. User-facing download names stay uuid4 (unguessable).
+_TMP_TAG = f"{os.getpid()}_{uuid.uuid4().hex[:8]}"
+_tmp_counter = itertools.count()
+
+
+def _tmpid() -> str:
+    return f"{_TMP_TAG}_{next(_tmp_counter)}"
+
+
+def _rm(path) -> None:
+    """Delete a temp file, ignoring one that is already gone."""
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+
+
+def _rm_many(paths: list[str]) -> None:
+    for path in paths:
+        _rm(path)
+
+
+def _collect_chunks(prefix: str, ext: str, ok: bool) -> list[tuple[str, float]]:
+    """Gather segment-muxer output files as (chunk_path, offset_seconds) tuples."""
+    with os.scandir(SRT_DIR) as it:
+        entries = sorted(
+            (e for e in it if e.name.startswith(prefix) and e.name.endswith(ext)),
+            key=lambda e: e.name,
+        )
+
+    chunks = []
+    for idx, entry in enumerate(entries):
+        if not ok or entry.stat().st_size < 1000:
+            # Failed run or negligible trailing chunk
+            _rm(entry.path)
+            continue
+        chunks.append((entry.path, float(idx * CHUNK_DURATION_SEC)))
+    return chunks
+
+
+def _stream_segments(
+    youtube_url: str, fmt: str, codec_args: list[str], ext: str
+) -> tuple[list[tuple[str, float]], str]:
+    """Pipe yt-dlp's audio stream into ffmpeg's segment muxer.
+
+    The full-length audio never touches disk. Returns the list of
+    (chunk_path, offset_seconds) tuples, empty if either process failed,
+    and yt-dlp's stderr (just its error lines under --quiet).
+    """
+    prefix = f"chunk_{_tmpid()}_"
+    # yt-dlp's stderr goes to a file: an undrained pipe could fill up, block
+    # yt-dlp and starve ffmpeg of EOF
+    with tempfile.TemporaryFile() as ytdlp_err:
+        ytdlp = subprocess.Popen(
+            [
+                sys.executable, "-m", "yt_dlp",
+                "-f", fmt,
+                "--concurrent-fragments", str(YTDLP_CONCURRENT_FRAGMENTS),
+                "--retries", "3", "--fragment-retries", "3",
+                "--quiet", "--no-warnings",
+                "-o", "-", youtube_url,
+            ],
+            stdout=subprocess.PIPE,
+            stderr=ytdlp_err,
+        )
+        # Widen the kernel pipe so yt-dlp's bursts don't stall on ffmpeg; only
+        # Linux can resize pipes, elsewhere the OS default stays
+        if fcntl is not None and hasattr(fcntl, "F_SETPIPE_SZ"):
+            try:
+                fcntl.fcntl(ytdlp.stdout.fileno(), fcntl.F_SETPIPE_SZ, PIPE_BUFSIZE)
+            except OSError:
+                pass  # above /proc/sys/fs/pipe-max-size
+        ffmpeg = subprocess.Popen(
+            [
+                "ffmpeg", "-y", "-i", "pipe:0", "-vn",
+                *codec_args,
+                "-f", "segment",
+                "-segment_time", str(CHUNK_DURATION_SEC),
+                "-reset_timestamps", "1",
+                str(SRT_DIR / f"{prefix}%03d{ext}"),
+            ],
+            stdin=ytdlp.stdout,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        # Let yt-dlp receive SIGPIPE if ffmpeg exits early
+        ytdlp.stdout.close()
+        ffmpeg.wait()
+        ytdlp.wait()
+        ytdlp_err.seek(0)
+        err = ytdlp_err.read()
+
+    chunks = _collect_chunks(prefix, ext, ytdlp.returncode == 0 and ffmpeg.returncode == 0)
+    return chunks, err.decode(errors="replace").strip()
+
+
+def _download_chunks(youtube_url: str) -> list[tuple[str, float]]:
+    """Download YouTube audio as Groq-ready chunks.
+
+    YouTube's Opus stream is stream-copied into webm chunks (no re-encode);
+    videos without an Opus format fall back to mono mp3.
+    """
+    chunks, err = _stream_segments(youtube_url, "bestaudio[acodec=opus]", ["-c", "copy"], ".webm")
+    # Only a missing Opus format is worth a second extraction; private,
+    # removed or unreachable videos would just fail again
+    if not chunks and _YTDLP_FORMAT_UNAVAILABLE in err:
+        chunks, err = _stream_segments(
+            youtube_url, "bestaudio/best",
+            ["-acodec", "libmp3lame", "-ab", "128k", "-ac", "1"], ".mp3",
+        )
+    if not chunks:
+        # Surface yt-dlp's own error line (e.g. "Video unavailable")
+        raise RuntimeError(err.splitlines()[-1] if err else "yt-dlp failed to produce an audio file")
+    return chunks
 
 
 def _split_audio(audio_path: str) -> list[tuple[str, float]]:
@@ -166,58 +329,101 @@ def _split_audio(audio_path: str) -> list[tuple[str, float]]:
     Returns list of (chunk_path, offset_seconds) tuples.
     If file is small enough, returns [(original_path, 0.0)].
     """
-    if Path(audio_path).stat().st_size <= GROQ_MAX_FILE_SIZE:
+    if os.stat(audio_path).st_size <= GROQ_MAX_FILE_SIZE:
         return [(audio_path, 0.0)]
 
-    chunks = []
-    offset = 0.0
-    idx = 0
-    while True:
-        chunk_path = str(SRT_DIR / f"chunk_{uuid.uuid4()}_{idx}.mp3")
-        proc = subprocess.run(
-            [
-                "ffmpeg", "-y", "-i", audio_path,
-                "-ss", str(offset),
-                "-t", str(CHUNK_DURATION_SEC),
-                "-acodec", "libmp3lame", "-ab", "128k",
-                "-ac", "1", chunk_path,
-            ],
-            capture_output=True,
-        )
-        if proc.returncode != 0 or not Path(chunk_path).exists():
-            break
-        if Path(chunk_path).stat().st_size < 1000:
-            # Empty/negligible chunk means we've passed the end
-            Path(chunk_path).unlink(missing_ok=True)
-            break
-        chunks.append((chunk_path, offset))
-        offset += CHUNK_DURATION_SEC
-        idx += 1
+    # One ffmpeg pass with the segment muxer; stream copy avoids re-encoding
+    ext = Path(audio_path).suffix or ".mp3"
+    prefix = f"chunk_{_tmpid()}_"
+    proc = subprocess.run(
+        [
+            "ffmpeg", "-y", "-i", audio_path,
+            "-f", "segment",
+            "-segment_time", str(CHUNK_DURATION_SEC),
+            "-reset_timestamps", "1",
+            "-c", "copy",
+            str(SRT_DIR / f"{prefix}%03d{ext}"),
+        ],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
 
+    chunks = _collect_chunks(prefix, ext, proc.returncode == 0)
     return chunks if chunks else [(audio_path, 0.0)]
 
 
-def _convert_to_wav(input_bytes: bytes) -> str:
-    """Convert arbitrary audio bytes (webm/ogg) to 16 kHz mono wav via ffmpeg."""
-    in_path = SRT_DIR / f"live_in_{uuid.uuid4()}.webm"
-    out_path = SRT_DIR / f"live_out_{uuid.uuid4()}.wav"
-    in_path.write_bytes(input_bytes)
+async def _convert_to_wav(input_bytes: bytes) -> bytes:
+    """Convert audio bytes (webm/ogg) to 16 kHz mono wav in memory via ffmpeg pipes."""
+    proc = await asyncio.create_subprocess_exec(
+        "ffmpeg", "-i", "pipe:0",
+        "-ar", "16000", "-ac", "1", "-f", "wav", "pipe:1",
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+    )
+    wav_bytes, _ = await proc.communicate(input_bytes)
+    if proc.returncode != 0 or not wav_bytes:
+        raise RuntimeError("ffmpeg conversion failed")
+    return wav_bytes
+
+
+def _save_upload(src, dest: str, max_bytes: int) -> bool:
+    """Copy an upload to dest in 1 MB blocks.
+
+    Returns False (leaving no file behind) if it exceeds max_bytes.
+    """
+    total = 0
+    with open(dest, "wb") as out:
+        while block := src.read(UPLOAD_BLOCK_SIZE):
+            total += len(block)
+            if total > max_bytes:
+                break
+            out.write(block)
+    if total > max_bytes:
+        _rm(dest)
+        return False
+    return True
+
+
+def _probe_audio(path: str) -> tuple[int, int, str] | None:
+    """Return (sample_rate, channels, sample_fmt) of the first audio stream, or None."""
     proc = subprocess.run(
         [
-            "ffmpeg", "-y", "-i", str(in_path),
-            "-ar", "16000", "-ac", "1", "-f", "wav", str(out_path),
+            "ffprobe", "-v", "error", "-select_streams", "a:0",
+            "-show_entries", "stream=sample_rate,channels,sample_fmt",
+            "-of", "default=noprint_wrappers=1", path,
         ],
         capture_output=True,
+        text=True,
     )
-    in_path.unlink(missing_ok=True)
-    if proc.returncode != 0 or not out_path.exists():
-        raise RuntimeError("ffmpeg conversion failed")
-    return str(out_path)
+    fields = dict(line.split("=", 1) for line in proc.stdout.splitlines() if "=" in line)
+    try:
+        return int(fields["sample_rate"]), int(fields["channels"]), fields.get("sample_fmt", "")
+    except (KeyError, ValueError):
+        return None
+
+
+def _can_pass_through(path: str) -> bool:
+    """True if an upload is already 16kHz mono in a Groq-ready, chunkable format."""
+    ext = Path(path).suffix.lower()
+    if ext not in _PASSTHROUGH_EXTS:
+        return False
+    probe = _probe_audio(path)
+    if probe is None or probe[:2] != (16000, 1):
+        return False
+    return ext not in _LOSSLESS_EXTS or probe[2] == "s16"
 
 
 def _normalize_audio(input_path: str) -> str:
-    """Normalize audio to 16kHz mono for optimal transcription."""
-    out_path = str(SRT_DIR / f"norm_{uuid.uuid4()}.mp3")
+    """Normalize audio to 16kHz mono for optimal transcription.
+
+    Audio-only uploads that are already 16kHz mono are returned unchanged;
+    everything else is re-encoded through the speech band-pass filter.
+    """
+    if _can_pass_through(input_path):
+        return input_path
+
+    out_path = str(SRT_DIR / f"norm_{_tmpid()}.mp3")
     proc = subprocess.run(
         [
             "ffmpeg", "-y", "-i", input_path,
@@ -225,125 +431,269 @@ def _normalize_audio(input_path: str) -> str:
             "-af", "highpass=f=200,lowpass=f=3000",
             out_path
         ],
-        capture_output=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
     )
-    if proc.returncode != 0 or not Path(out_path).exists():
+    if proc.returncode != 0 or not os.path.exists(out_path):
         raise RuntimeError("Audio normalization failed")
     return out_path
 
 
 def _format_ts(seconds: float) -> str:
-    h = int(seconds // 3600)
-    m = int((seconds % 3600) // 60)
-    s = int(seconds % 60)
-    ms = int((seconds % 1) * 1000)
+    ms_total = int(seconds * 1000)
+    h, rem = divmod(ms_total, 3_600_000)
+    m, rem = divmod(rem, 60_000)
+    s, ms = divmod(rem, 1000)
     return f"{h:02d}:{m:02d}:{s:02d},{ms:03d}"
 
 
+@functools.lru_cache(maxsize=16384)
+def _s2t_convert(text: str) -> str:
+    """Memoized OpenCC s2t conversion (transcripts repeat many phrases)."""
+    return _get_s2t().convert(text)
+
+
 def _convert_chinese(text: str, language: str) -> str:
     """Cantonese -> Traditional Chinese, Mandarin -> Simplified (no-op)."""
     if language == "yue":
-        return _s2t.convert(text)
+        if len(text) < _CLAUSE_SPLIT_MIN_LEN:
+            return _s2t_convert(text)
+        # Cache per clause so repeated sentences inside long segments hit
+        return "".join(_s2t_convert(c) for c in _CLAUSE_SPLIT.split(text) if c)
     return text
 
 
-def _build_srt(segments, language: str = "yue") -> str:
-    """Build SRT string from Groq Whisper segments.
+def _convert_chinese_batch(texts: list[str], language: str) -> list[str]:
+    """Convert many segments with one OpenCC call instead of one per segment."""
+    if language != "yue" or not texts:
+        return texts
+    converted = _get_s2t().convert(_BATCH_SEP.join(texts)).split(_BATCH_SEP)
+    if len(converted) != len(texts):
+        # Separator didn't survive conversion; fall back to per-segment
+        return [_convert_chinese(t, language) for t in texts]
+    return converted
+
+
+def _segment_rows(segments: list) -> Iterator[tuple[float, float, str]]:
+    """Yield Groq segments as (start, end, text), picking dict/object access once."""
+    if segments and isinstance(segments[0], dict):
+        return ((seg["start"], seg["end"], seg.get("text", "")) for seg in segments)
+    return ((seg.start, seg.end, seg.text) for seg in segments)
+
+
+def _build_srt(rows: list[tuple[float, float, str]], language: str = "yue") -> str:
+    """Build SRT string from (start, end, text) rows in seconds."""
+    cleaned: list[tuple[float, float, str]] = []
+    for start, end, raw_text in rows:
+        text = raw_text.strip()
+        if text:
+            cleaned.append((start, end, text))
+
+    texts = _convert_chinese_batch([text for _, _, text in cleaned], language)
+    return "".join(
+        f"{i}\n{_format_ts(start)} --> {_format_ts(end)}\n{text}\n\n"
+        for i, ((start, end, _), text) in enumerate(zip(cleaned, texts), 1)
+    )
+
+
+async def _redis_get(key: str) -> str | None:
+    """Read from the shared cache; a missing or unreachable Redis is a miss."""
+    if _redis is None:
+        return None
+    try:
+        return await _redis.get(key)
+    except RedisError:
+        return None
+
+
+async def _redis_set(key: str, value: str) -> None:
+    """Best-effort write to the shared cache."""
+    if _redis is None:
+        return
+    try:
+        await _redis.set(key, value, ex=REDIS_CACHE_TTL_SEC)
+    except RedisError:
+        pass
+
+
+def _publish_transcript(srt_content: str, cache_path: Path | None) -> str:
+    """Give a transcript an unguessable download name and return it.
 
-    Each segment has .start (float seconds), .end (float seconds), .text (str).
+    Cache entries are hard-linked rather than rewritten; their own names are
+    derived from public data, so they are never handed out.
     """
-    lines: list[str] = []
-    idx = 1
+    filename = f"{uuid.uuid4()}.srt"
+    dest = SRT_DIR / filename
+    if cache_path:
+        try:
+            os.link(cache_path, dest)
+            return filename
+        except OSError:
+            pass  # evicted meanwhile, or no hard links here; write a copy
+    dest.write_text(srt_content, encoding="utf-8")
+    return filename
 
-    for seg in segments:
-        text = (seg.get("text", "") if isinstance(seg, dict) else seg.text).strip()
-        if not text:
-            continue
-        text = _convert_chinese(text, language)
-        start = seg["start"] if isinstance(seg, dict) else seg.start
-        end = seg["end"] if isinstance(seg, dict) else seg.end
-        lines.append(f"{idx}")
-        lines.append(f"{_format_ts(start)} --> {_format_ts(end)}")
-        lines.append(text)
-        lines.append("")
-        idx += 1
 
-    return "\n".join(lines)
+def _transcript_cache_path(youtube_url: str, language: str) -> Path | None:
+    """Canonical cache file for a (video_id, language) pair, or None if uncacheable."""
+    match = _VIDEO_ID_PATTERN.search(youtube_url)
+    if not match:
+        return None
+    digest = hashlib.sha256(f"{match.group(1)}:{language}".encode()).hexdigest()[:16]
+    return SRT_DIR / f"{_CACHE_PREFIX}{digest}.srt"
+
+
+def _read_cached_transcript(cache_path: Path) -> str | None:
+    """Return cached SRT content and mark it recently used, or None on a miss."""
+    try:
+        content = cache_path.read_text(encoding="utf-8")
+        os.utime(cache_path)
+    except FileNotFoundError:
+        return None
+    return content
+
+
+def _store_cached_transcript(cache_path: Path, srt_content: str) -> None:
+    """Write a transcript to the cache, evicting least recently used entries."""
+    # Write aside and rename so concurrent readers never see a partial file
+    tmp_path = SRT_DIR / f"tmp_{_tmpid()}.srt"
+    try:
+        tmp_path.write_text(srt_content, encoding="utf-8")
+        os.replace(tmp_path, cache_path)
+    except BaseException:
+        _rm(str(tmp_path))
+        raise
+
+    entries = []
+    total = 0
+    with os.scandir(SRT_DIR) as it:
+        for entry in it:
+            if entry.name.startswith(_CACHE_PREFIX) and entry.name.endswith(".srt"):
+                st = entry.stat()
+                entries.append((st.st_mtime, st.st_size, entry.path))
+                total += st.st_size
+
+    for _, size, path in sorted(entries):
+        if total <= TRANSCRIPT_CACHE_MAX_BYTES:
+            break
+        if path != str(cache_path):
+            _rm(path)
+            total -= size
+
+
+async def _transcribe_file(path: str, language: str):
+    """Transcribe one audio file with Groq Whisper (segment timestamps)."""
+    data = await asyncio.to_thread(Path(path).read_bytes)
+    return await groq_client.audio.transcriptions.create(
+        file=(f"audio{Path(path).suffix}", data),
+        model="whisper-large-v3",
+        language=language,
+        response_format="verbose_json",
+        timestamp_granularities=["segment"],
+    )
+
+
+async def _transcribe_chunks(
+    chunks: list[tuple[str, float]], language: str, remove: bool = False
+) -> list[tuple[float, float, str]]:
+    """Transcribe audio chunks concurrently, returning offset-adjusted
+    (start, end, text) rows.
+
+    Results are gathered in input order, so segments stay chronological.
+    With remove=True each chunk file is deleted as soon as its request ends.
+    """
+
+    async def _run(path: str, offset: float) -> list[tuple[float, float, str]]:
+        try:
+            async with _groq_sem:
+                transcription = await _transcribe_file(path, language)
+        finally:
+            if remove:
+                _rm(path)
+
+        segs = (transcription.segments if hasattr(transcription, "segments") else transcription.get("segments")) or []
+        rows = _segment_rows(segs)
+        if not offset:
+            return list(rows)
+        return [(start + offset, end + offset, text) for start, end, text in rows]
+
+    # Let every chunk finish (and clean up) before surfacing a failure
+    results = await asyncio.gather(*(_run(p, o) for p, o in chunks), return_exceptions=True)
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+    return [row for rows in results for row in rows]
 
 
 # --------------- routes ---------------
 
 
 @app.post("/api/transcribe")
-async def transcribe_youtube(req: TranscribeRequest):
-    if not YOUTUBE_URL_PATTERN.match(req.youtube_url):
-        return JSONResponse(
+async def transcribe_youtube(req: TranscribeRequest, accept: str = Header("")):
+    if not req.youtube_url.startswith(YOUTUBE_URL_PREFIXES):
+        return ORJSONResponse(
             status_code=400,
             content={"error": "Invalid YouTube URL. Provide a youtube.com or youtu.be link."},
         )
 
     try:
-        audio_path = await asyncio.to_thread(_download_audio, req.youtube_url)
-        chunks = await asyncio.to_thread(_split_audio, audio_path)
-
-        all_segments = []
-        for chunk_path, offset in chunks:
-            def _transcribe(path=chunk_path, language=req.language):
-                with open(path, "rb") as f:
-                    return groq_client.audio.transcriptions.create(
-                        file=("audio.mp3", f),
-                        model="whisper-large-v3",
-                        language=language,
-                        response_format="verbose_json",
-                        timestamp_granularities=["segment"],
-                    )
-
-            transcription = await asyncio.to_thread(_transcribe)
-
-            segs = transcription.segments if hasattr(transcription, "segments") else transcription.get("segments", [])
-            for seg in segs:
-                if isinstance(seg, dict):
-                    seg["start"] = seg.get("start", 0) + offset
-                    seg["end"] = seg.get("end", 0) + offset
-                else:
-                    seg.start += offset
-                    seg.end += offset
-                all_segments.append(seg)
-
-            # Clean up chunk if it's not the original file
-            if chunk_path != audio_path:
-                Path(chunk_path).unlink(missing_ok=True)
-
-        srt_content = _build_srt(all_segments, language=req.language)
-
-        filename = f"{uuid.uuid4()}.srt"
-        (SRT_DIR / filename).write_text(srt_content, encoding="utf-8")
-
-        # clean up source audio
-        Path(audio_path).unlink(missing_ok=True)
+        # Repeat requests for the same video + language are served from the
+        # local disk cache, then the shared Redis cache
+        cache_path = _transcript_cache_path(req.youtube_url, req.language)
+        srt_content = None
+        if cache_path:
+            srt_content = await asyncio.to_thread(_read_cached_transcript, cache_path)
+            if srt_content is None:
+                srt_content = await _redis_get(f"srt:{cache_path.stem}")
+                if srt_content is not None and req.persist:
+                    await asyncio.to_thread(_store_cached_transcript, cache_path, srt_content)
+
+        if srt_content is None:
+            chunks = await asyncio.to_thread(_download_chunks, req.youtube_url)
+            rows = await _transcribe_chunks(chunks, req.language, remove=True)
+
+            srt_content = _build_srt(rows, language=req.language)
+            if cache_path:
+                if req.persist:
+                    await asyncio.to_thread(_store_cached_transcript, cache_path, srt_content)
+                await _redis_set(f"srt:{cache_path.stem}", srt_content)
+
+        # Clients that want the raw subtitles skip the JSON envelope entirely
+        if SRT_MEDIA_TYPE in accept:
+            return Response(srt_content, media_type=SRT_MEDIA_TYPE)
+
+        # Per-request download name stays unguessable
+        filename = None
+        if req.persist:
+            filename = await asyncio.to_thread(_publish_transcript, srt_content, cache_path)
 
         return {
             "srt_content": srt_content,
-            "preview": srt_content[:1000],
             "filename": filename,
         }
 
     except Exception as exc:
-        return JSONResponse(status_code=500, content={"error": str(exc)})
+        return ORJSONResponse(status_code=500, content={"error": str(exc)})
 
 
 @app.get("/api/download/{filename}")
 async def download_file(filename: str):
-    # Prevent path traversal
-    if "/" in filename or "\\" in filename or ".." in filename:
-        return JSONResponse(status_code=400, content={"error": "Invalid filename"})
-    filepath = SRT_DIR / filename
-    if not filepath.exists():
-        return JSONResponse(status_code=404, content={"error": "File not found"})
+    # Prevent path traversal: the resolved file must sit directly in SRT_DIR
+    try:
+        filepath = (SRT_ROOT / filename).resolve(strict=True)
+    except FileNotFoundError:
+        return ORJSONResponse(status_code=404, content={"error": "File not found"})
+    except (OSError, ValueError):
+        return ORJSONResponse(status_code=400, content={"error": "Invalid filename"})
+    if filepath.parent != SRT_ROOT or not filepath.is_file():
+        return ORJSONResponse(status_code=400, content={"error": "Invalid filename"})
+    # Cache entries are only reachable through their per-request links
+    if filepath.name.startswith(_CACHE_PREFIX):
+        return ORJSONResponse(status_code=404, content={"error": "File not found"})
 
     # Determine media type based on extension
     if filename.endswith(".srt"):
-        media_type = "application/x-subrip"
+        media_type = SRT_MEDIA_TYPE
     elif filename.endswith(".txt"):
         media_type = "text/plain; charset=utf-8"
     else:
@@ -356,130 +706,268 @@ async def download_file(filename: str):
     )
 
 
-@app.websocket("/api/live-stt")
-async def live_stt(websocket: WebSocket):
-    await websocket.accept()
-    try:
-        # Client sends first message with optional config
-        init = await websocket.receive_json()
-        lang = init.get("language", "yue")
-
-        while True:
-            audio_bytes = await websocket.receive_bytes()
-            if len(audio_bytes) < 100:
-                continue
+async def _transcribe_live_audio(name: str, data: bytes, language: str):
+    """Transcribe one short live-STT clip with Groq Whisper (text only)."""
+    async with _groq_sem:
+        return await groq_client.audio.transcriptions.create(
+            file=(name, data),
+            model="whisper-large-v3",
+            language=language,
+            response_format="json",
+        )
 
-            wav_path = await asyncio.to_thread(_convert_to_wav, audio_bytes)
 
-            def _transcribe_chunk(path=wav_path, language=lang):
-                with open(path, "rb") as f:
-                    return groq_client.audio.transcriptions.create(
-                        file=("chunk.wav", f),
-                        model="whisper-large-v3",
-                        language=language,
-                        response_format="json",
-                    )
+async def _transcribe_live_chunk(audio_bytes: bytes, language: str) -> str:
+    """Transcribe one live-STT chunk, returning display text.
 
-            transcription = await asyncio.to_thread(_transcribe_chunk)
+    The browser's webm/opus clip goes to Groq as-is; ffmpeg is only used to
+    re-wrap it as wav if Groq rejects the container.
+    """
+    try:
+        transcription = await _transcribe_live_audio("chunk.webm", audio_bytes, language)
+    except BadRequestError:
+        wav_bytes = await _convert_to_wav(audio_bytes)
+        transcription = await _transcribe_live_audio("chunk.wav", wav_bytes, language)
+
+    raw_text = transcription.text if hasattr(transcription, "text") else transcription.get("text", "")
+    text = raw_text.strip() if raw_text else ""
+    if text:
+        text = _convert_chinese(text, language)
+    return text
 
-            Path(wav_path).unlink(missing_ok=True)
 
-            raw_text = transcription.text if hasattr(transcription, "text") else transcription.get("text", "")
-            text = raw_text.strip() if raw_text else ""
-            if text:
-                text = _convert_chinese(text, lang)
+@app.websocket("/api/live-stt")
+async def live_stt(websocket: WebSocket):
+    await websocket.accept()
+    # In-flight chunk tasks, in arrival order. Chunk N+1 is transcribed while
+    # chunk N is still with Groq; results are still sent in order. A slot is
+    # held from task creation until its result is sent.
+    pending: asyncio.Queue = asyncio.Queue()
+    slots = asyncio.Semaphore(LIVE_PIPELINE_DEPTH)
 
-            await websocket.send_json({"text": text})
+    async def _send_results():
+        while True:
+            task = await pending.get()
+            try:
+                text = await task
+            except Exception as exc:
+                # A failed chunk ends the session, reported to the client
+                await websocket.send_text(orjson.dumps({"error": str(exc)}).decode())
+                return
+            slots.release()
+            await websocket.send_text(orjson.dumps({"text": text}).decode())
+
+    async def _unless_stopped(aw):
+        """Await aw, or cancel it and return None once the sender has finished."""
+        step = asyncio.ensure_future(aw)
+        await asyncio.wait({step, sender}, return_when=asyncio.FIRST_COMPLETED)
+        if step.done():
+            return step.result()
+        step.cancel()
+        return None
+
+    sender = None
+    try:
+        # Client sends first message with optional config; pydantic-core
+        # parses the raw frame directly
+        init = LiveSTTConfig.model_validate_json(await websocket.receive_text())
+        lang = init.language
+        sender = asyncio.create_task(_send_results())
+
+        while not sender.done():
+            audio_bytes = await _unless_stopped(websocket.receive_bytes())
+            if audio_bytes is None or len(audio_bytes) < 100:
+                continue
+            # Reserve a pipeline slot before starting the Groq call
+            if await _unless_stopped(slots.acquire()):
+                pending.put_nowait(asyncio.create_task(_transcribe_live_chunk(audio_bytes, lang)))
 
     except WebSocketDisconnect:
         pass
     except Exception as exc:
         try:
-            await websocket.send_json({"error": str(exc)})
+            await websocket.send_text(orjson.dumps({"error": str(exc)}).decode())
         except Exception:
             pass
+    finally:
+        if sender:
+            sender.cancel()
+            # A failed send (client gone) is not worth reporting
+            await asyncio.gather(sender, return_exceptions=True)
+        while not pending.empty():
+            pending.get_nowait().cancel()
 
 
-async def _call_ollama(text: str, mode: str) -> str:
-    """Call Ollama Cloud API for summarization / polishing."""
+def _ollama_payload(text: str, mode: str, stream: bool) -> dict:
+    """Build the Ollama chat request for summarization / polishing."""
     if not OLLAMA_API_KEY:
         raise RuntimeError("OLLAMA_API_KEY not configured")
 
     system_prompt = _SUMMARY_PROMPT if mode == "summary" else _POLISH_PROMPT
 
-    payload = {
+    return {
         "model": OLLAMA_MODEL,
         "messages": [
             {"role": "system", "content": system_prompt},
             {"role": "user", "content": text},
         ],
-        "stream": False,
+        "stream": stream,
     }
 
-    async with httpx.AsyncClient(timeout=120.0) as client:
-        resp = await client.post(
-            OLLAMA_ENDPOINT,
-            json=payload,
-            headers={"Authorization": f"Bearer {OLLAMA_API_KEY}"},
-        )
+
+async def _call_ollama(text: str, mode: str) -> str:
+    """Call Ollama Cloud API for summarization / polishing."""
+    resp = await _ollama_client.post(
+        OLLAMA_ENDPOINT,
+        json=_ollama_payload(text, mode, stream=False),
+        headers={"Authorization": f"Bearer {OLLAMA_API_KEY}"},
+    )
+    resp.raise_for_status()
+    data = resp.json()
+    return data["message"]["content"]
+
+
+async def _stream_ollama(text: str, mode: str) -> AsyncIterator[str]:
+    """Call Ollama Cloud API with streaming, yielding content pieces as generated.
+
+    Raises RuntimeError if Ollama reports an error mid-stream or the stream
+    ends before its final "done" chunk.
+    """
+    async with _ollama_client.stream(
+        "POST",
+        OLLAMA_ENDPOINT,
+        json=_ollama_payload(text, mode, stream=True),
+        headers={"Authorization": f"Bearer {OLLAMA_API_KEY}"},
+    ) as resp:
         resp.raise_for_status()
-        data = resp.json()
-        return data["message"]["content"]
+        # Ollama streams newline-delimited JSON chunks
+        async for line in resp.aiter_lines():
+            if not line:
+                continue
+            chunk = orjson.loads(line)
+            if "error" in chunk:
+                raise RuntimeError(f"Ollama API error: {chunk['error']}")
+            content = chunk.get("message", {}).get("content")
+            if content:
+                yield content
+            if chunk.get("done"):
+                return
+    raise RuntimeError("Ollama stream ended before completion")
 
 
-def _format_minutes_text(segments: list, language: str, include_timestamps: bool) -> str:
-    """Format Groq Whisper segments as plain text or timestamped text."""
-    if not segments:
-        return ""
+async def _get_cached_summary(cache_key: str) -> str | None:
+    """Look up a summary in the in-process LRU, then the shared Redis cache."""
+    if cache_key in _summary_cache:
+        _summary_cache.move_to_end(cache_key)
+        return _summary_cache[cache_key]
+    result = await _redis_get(cache_key)
+    if result is not None:
+        _remember_summary(cache_key, result)
+    return result
 
-    if not include_timestamps:
-        parts = []
-        for seg in segments:
-            text = seg.text if hasattr(seg, "text") else seg.get("text", "")
-            parts.append(text.strip())
-        full = " ".join(parts)
-        return _convert_chinese(full, language)
 
-    # Format with timestamps per segment
-    lines = []
-    for seg in segments:
-        start = seg.start if hasattr(seg, "start") else seg.get("start", 0)
-        text = seg.text if hasattr(seg, "text") else seg.get("text", "")
-        text = _convert_chinese(text.strip(), language)
-        ts = f"[{int(start // 60):02d}:{int(start % 60):02d}]"
-        lines.append(f"{ts} {text}")
+def _remember_summary(cache_key: str, result: str) -> None:
+    _summary_cache[cache_key] = result
+    _summary_cache.move_to_end(cache_key)
+    if len(_summary_cache) > SUMMARY_CACHE_SIZE:
+        _summary_cache.popitem(last=False)
 
-    return "\n".join(lines)
+
+async def _store_summary(cache_key: str, result: str) -> None:
+    _remember_summary(cache_key, result)
+    await _redis_set(cache_key, result)
+
+
+def _sse(data: dict) -> str:
+    return f"data: {orjson.dumps(data).decode()}\n\n"
+
+
+async def _summary_events(text: str, mode: str, cache_key: str) -> AsyncIterator[str]:
+    """Server-sent events for /api/summarize?stream=1: {"text"} pieces or {"error"}."""
+    cached = await _get_cached_summary(cache_key)
+    if cached is not None:
+        yield _sse({"text": cached})
+        return
+
+    parts = []
+    try:
+        async for piece in _stream_ollama(text, mode):
+            parts.append(piece)
+            yield _sse({"text": piece})
+    except httpx.HTTPStatusError as exc:
+        yield _sse({"error": f"Ollama API error: {exc.response.status_code}"})
+        return
+    except Exception as exc:
+        yield _sse({"error": str(exc)})
+        return
+
+    # Only complete, non-empty results are cached
+    if parts:
+        await _store_summary(cache_key, "".join(parts))
+
+
+def _format_minutes_text(
+    rows: list[tuple[float, float, str]], language: str, include_timestamps: bool
+) -> str:
+    """Format (start, end, text) rows as plain text or timestamped text."""
+    if not rows:
+        return ""
+
+    if not include_timestamps:
+        full = " ".join(text.strip() for _, _, text in rows)
+        return _convert_chinese_batch([full], language)[0]
+
+    # Format with timestamps per segment; convert all lines in one OpenCC call
+    texts = _convert_chinese_batch([text.strip() for _, _, text in rows], language)
+    return "\n".join(
+        f"[{int(start // 60):02d}:{int(start % 60):02d}] {text}"
+        for (start, _, _), text in zip(rows, texts)
+    )
 
 
 @app.post("/api/summarize")
-async def summarize_text(req: SummarizeRequest):
+async def summarize_text(req: SummarizeRequest, stream: bool = False):
     if req.mode not in ("summary", "polish"):
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=400,
             content={"error": "Mode must be 'summary' or 'polish'."},
         )
     if not req.text or not req.text.strip():
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=400,
             content={"error": "Text content is required."},
         )
     if len(req.text) > 50000:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=400,
             content={"error": "Text too long (max 50 000 characters)."},
         )
 
+    text = req.text.strip()
+    cache_key = "summary:" + hashlib.blake2b(
+        f"{req.mode}\0{text}".encode(), digest_size=16
+    ).hexdigest()
+
+    if stream:
+        return StreamingResponse(
+            _summary_events(text, req.mode, cache_key),
+            media_type="text/event-stream",
+        )
+
     try:
-        result = await _call_ollama(req.text.strip(), req.mode)
+        result = await _get_cached_summary(cache_key)
+        if result is None:
+            result = await _call_ollama(text, req.mode)
+            if result:
+                await _store_summary(cache_key, result)
         return {"summary": result}
     except httpx.HTTPStatusError as exc:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content={"error": f"Ollama API error: {exc.response.status_code}"},
         )
     except Exception as exc:
-        return JSONResponse(status_code=500, content={"error": str(exc)})
+        return ORJSONResponse(status_code=500, content={"error": str(exc)})
 
 
 @app.post("/api/minutes")
@@ -491,67 +979,45 @@ async def transcribe_minutes(
     """Transcribe uploaded audio file using Groq Whisper API."""
     # Validate file
     if not file.filename:
-        return JSONResponse(status_code=400, content={"error": "No file provided"})
+        return ORJSONResponse(status_code=400, content={"error": "No file provided"})
 
     ext = Path(file.filename).suffix.lower()
     if ext not in {".mp3", ".wav", ".m4a", ".ogg", ".flac", ".webm", ".mp4", ".mov"}:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=400,
             content={"error": f"Unsupported format: {ext}. Use mp3, wav, m4a, ogg, flac, webm, mp4, or mov."},
         )
 
-    content = await file.read()
-    if len(content) > MINUTES_MAX_FILE_SIZE:
-        return JSONResponse(
+    # Save uploaded file, streaming it in blocks rather than reading it whole
+    input_path = str(SRT_DIR / f"upload_{_tmpid()}{ext}")
+    saved = await asyncio.to_thread(_save_upload, file.file, input_path, MINUTES_MAX_FILE_SIZE)
+    if not saved:
+        return ORJSONResponse(
             status_code=400,
             content={"error": "File too large (max 100MB)"},
         )
-
-    # Save uploaded file
-    input_path = str(SRT_DIR / f"upload_{uuid.uuid4()}{ext}")
-    Path(input_path).write_bytes(content)
     norm_path = None
     chunk_paths = []
 
     try:
-        # Normalize audio
+        # Normalize audio (skipped when the upload is already 16kHz mono)
         norm_path = await asyncio.to_thread(_normalize_audio, input_path)
 
         # Split into chunks if needed (Groq 25MB limit)
         chunks = await asyncio.to_thread(_split_audio, norm_path)
         chunk_paths = [p for p, _ in chunks if p != norm_path]
 
-        # Transcribe each chunk with Groq Whisper
-        all_segments = []
-        for chunk_path, offset in chunks:
-            def _transcribe(path=chunk_path, lang=language):
-                with open(path, "rb") as f:
-                    return groq_client.audio.transcriptions.create(
-                        file=("audio.mp3", f),
-                        model="whisper-large-v3",
-                        language=lang,
-                        response_format="verbose_json",
-                        timestamp_granularities=["segment"],
-                    )
-
-            transcription = await asyncio.to_thread(_transcribe)
-
-            segs = transcription.segments if hasattr(transcription, "segments") else transcription.get("segments", [])
-            for seg in segs:
-                if isinstance(seg, dict):
-                    seg["start"] = seg.get("start", 0) + offset
-                    seg["end"] = seg.get("end", 0) + offset
-                else:
-                    seg.start += offset
-                    seg.end += offset
-                all_segments.append(seg)
+        # Transcribe all chunks concurrently with Groq Whisper
+        rows = await _transcribe_chunks(chunks, language)
 
         # Format output
-        text = _format_minutes_text(all_segments, language, include_timestamps)
+        text = _format_minutes_text(rows, language, include_timestamps)
 
         # Save for download
         txt_filename = f"{uuid.uuid4()}.txt"
-        (SRT_DIR / txt_filename).write_text(text, encoding="utf-8")
+        await asyncio.to_thread(
+            (SRT_DIR / txt_filename).write_text, text, encoding="utf-8"
+        )
 
         return {
             "text": text,
@@ -560,13 +1026,12 @@ async def transcribe_minutes(
         }
 
     except Exception as exc:
-        return JSONResponse(status_code=500, content={"error": str(exc)})
+        return ORJSONResponse(status_code=500, content={"error": str(exc)})
     finally:
-        Path(input_path).unlink(missing_ok=True)
+        temp_paths = [input_path, *chunk_paths]
         if norm_path:
-            Path(norm_path).unlink(missing_ok=True)
-        for cp in chunk_paths:
-            Path(cp).unlink(missing_ok=True)
+            temp_paths.append(norm_path)
+        await asyncio.to_thread(_rm_many, temp_paths)
 
 
 @app.get("/health")